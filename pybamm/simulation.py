@@ -7,6 +7,7 @@ import numpy as np
 import copy
 import warnings
 import sys
+from pybamm.logger import NOTICE_LEVEL_NUM
 
 
 def is_notebook():
@@ -744,7 +745,17 @@ class Simulation:
             else:
                 esoh_sim = None
 
-            voltage_stop = self.experiment.termination.get("voltage")
+            # Look up the termination conditions once, rather than every cycle
+            capacity_termination = self.experiment.termination.get("capacity")
+            voltage_termination = self.experiment.termination.get("voltage")
+            if voltage_termination is not None:
+                voltage_stop = voltage_termination[0]
+            else:
+                voltage_stop = None
+
+            # The step log is the densest log in the experiment loop, so check
+            # once whether it would be emitted and skip building it otherwise
+            notice_enabled = pybamm.logger.isEnabledFor(NOTICE_LEVEL_NUM)
 
             idx = 0
             num_cycles = len(self.experiment.cycle_lengths)
@@ -753,8 +764,10 @@ class Simulation:
                 self.experiment.cycle_lengths, start=1
             ):
                 pybamm.logger.notice(
-                    f"Cycle {cycle_num+cycle_offset}/{num_cycles+cycle_offset} "
-                    f"({timer.time()} elapsed) " + "-" * 20
+                    "Cycle %d/%d (%s elapsed) " + "-" * 20,
+                    cycle_num + cycle_offset,
+                    num_cycles + cycle_offset,
+                    timer.time(),
                 )
                 steps = []
                 cycle_solution = None
@@ -779,17 +792,21 @@ class Simulation:
                 for step_num in range(1, cycle_length + 1):
                     exp_inputs = self._experiment_inputs[idx]
                     dt = self._experiment_times[idx]
-                    op_conds_str = self.experiment.operating_conditions_strings[idx]
                     op_conds_elec = self.experiment.operating_conditions[idx][
                         "electric"
                     ]
                     model = self.op_conds_to_built_models[op_conds_elec]
                     # Use 1-indexing for printing cycle number as it is more
                     # human-intuitive
-                    pybamm.logger.notice(
-                        f"Cycle {cycle_num+cycle_offset}/{num_cycles+cycle_offset}, "
-                        f"step {step_num}/{cycle_length}: {op_conds_str}"
-                    )
+                    if notice_enabled:
+                        pybamm.logger.notice(
+                            "Cycle %d/%d, step %d/%d: %s",
+                            cycle_num + cycle_offset,
+                            num_cycles + cycle_offset,
+                            step_num,
+                            cycle_length,
+                            self.experiment.operating_conditions_strings[idx],
+                        )
                     inputs.update(exp_inputs)
                     if current_solution is None:
                         start_time = 0
@@ -827,16 +844,15 @@ class Simulation:
                 # Break if the experiment is infeasible
                 if feasible is False:
                     pybamm.logger.warning(
-                        "\n\n\tExperiment is infeasible: '{}' ".format(
-                            step_solution.termination
-                        )
-                        + "was triggered during '{}'. ".format(
-                            self.experiment.operating_conditions_strings[idx]
-                        )
-                        + "The returned solution only contains the first "
-                        "{} cycles. ".format(cycle_num - 1 + cycle_offset)
-                        + "Try reducing the current, shortening the time interval, "
-                        "or reducing the period.\n\n"
+                        "\n\n\tExperiment is infeasible: '%s' "
+                        "was triggered during '%s'. "
+                        "The returned solution only contains the first "
+                        "%d cycles. "
+                        "Try reducing the current, shortening the time interval, "
+                        "or reducing the period.\n\n",
+                        step_solution.termination,
+                        self.experiment.operating_conditions_strings[idx],
+                        cycle_num - 1 + cycle_offset,
                     )
                     break
 
@@ -859,11 +875,11 @@ class Simulation:
 
                 # Calculate capacity_start using the first cycle
                 if cycle_num == 1:
-                    if "capacity" in self.experiment.termination:
+                    if capacity_termination is not None:
                         # Note capacity_start could be defined as
                         # self.parameter_values["Nominal cell capacity [A.h]"] instead
                         capacity_start = all_summary_variables[0]["Capacity [A.h]"]
-                        value, typ = self.experiment.termination["capacity"]
+                        value, typ = capacity_termination
                         if typ == "Ah":
                             capacity_stop = value
                         elif typ == "%":
@@ -873,33 +889,39 @@ class Simulation:
 
                 if capacity_stop is not None:
                     capacity_now = cycle_summary_variables["Capacity [A.h]"]
-                    if np.isnan(capacity_now) or capacity_now > capacity_stop:
+                    # capacity_now != capacity_now is a cheap scalar NaN check
+                    if capacity_now != capacity_now or capacity_now > capacity_stop:
                         pybamm.logger.notice(
-                            f"Capacity is now {capacity_now:.3f} Ah "
-                            f"(originally {capacity_start:.3f} Ah, "
-                            f"will stop at {capacity_stop:.3f} Ah)"
+                            "Capacity is now %.3f Ah (originally %.3f Ah, "
+                            "will stop at %.3f Ah)",
+                            capacity_now,
+                            capacity_start,
+                            capacity_stop,
                         )
                     else:
                         pybamm.logger.notice(
-                            "Stopping experiment since capacity "
-                            f"({capacity_now:.3f} Ah) "
-                            f"is below stopping capacity ({capacity_stop:.3f} Ah)."
+                            "Stopping experiment since capacity (%.3f Ah) "
+                            "is below stopping capacity (%.3f Ah).",
+                            capacity_now,
+                            capacity_stop,
                         )
                         break
 
                 # Check voltage stop
                 if voltage_stop is not None:
                     min_voltage = np.min(cycle_solution["Battery voltage [V]"].data)
-                    if min_voltage > voltage_stop[0]:
+                    if min_voltage > voltage_stop:
                         pybamm.logger.notice(
-                            f"Minimum voltage is now {min_voltage:.3f} V "
-                            f"(will stop at {voltage_stop[0]:.3f} V)"
+                            "Minimum voltage is now %.3f V (will stop at %.3f V)",
+                            min_voltage,
+                            voltage_stop,
                         )
                     else:
                         pybamm.logger.notice(
-                            "Stopping experiment since minimum voltage "
-                            f"({min_voltage:.3f} V) "
-                            f"is below stopping voltage ({voltage_stop[0]:.3f} V)."
+                            "Stopping experiment since minimum voltage (%.3f V) "
+                            "is below stopping voltage (%.3f V).",
+                            min_voltage,
+                            voltage_stop,
                         )
                         break
 
@@ -908,9 +930,7 @@ class Simulation:
                 self.solution.set_summary_variables(all_summary_variables)
                 self.solution.all_first_states = all_first_states
 
-            pybamm.logger.notice(
-                "Finish experiment simulation, took {}".format(timer.time())
-            )
+            pybamm.logger.notice("Finish experiment simulation, took %s", timer.time())
 
         # reset parameter values
         if initial_soc is not None: